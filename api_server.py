@@ -4,9 +4,13 @@ Donizo Material Scraper API Server
 A simple Flask API to serve scraped material data.
 """
 
-from flask import Flask, jsonify, request
+from flask import Flask, request
+import orjson
 from scraper import MaterialScraper
+from utils.orjson_response import orjson_response
 import logging
+import os
+from datetime import datetime
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -30,7 +34,7 @@ def initialize_scraper():
 @app.route('/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
+    return orjson_response({
         "status": "healthy",
         "service": "Donizo Material Scraper API"
     })
@@ -50,14 +54,14 @@ def get_all_materials():
         else:
             # Return cached data if available, otherwise scrape
             response = scraper_instance.get_api_response()
-            return jsonify(response)
+            return orjson_response(response)
             
     except Exception as e:
         logger.error(f"Error in get_all_materials: {e}")
-        return jsonify({
+        return orjson_response({
             "status": "error",
             "message": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/materials/<category>', methods=['GET'])
 def get_materials_by_category(category):
@@ -65,45 +69,48 @@ def get_materials_by_category(category):
     try:
         scraper_instance = initialize_scraper()
         response = scraper_instance.get_api_response(category)
-        return jsonify(response)
+        return orjson_response(response)
         
     except Exception as e:
         logger.error(f"Error getting materials for category {category}: {e}")
-        return jsonify({
+        return orjson_response({
             "status": "error",
             "message": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/materials/supplier/<supplier>', methods=['GET'])
 def get_materials_by_supplier(supplier):
     """Get materials by specific supplier."""
     try:
         scraper_instance = initialize_scraper()
-        suppliers = [supplier] if supplier in ['leroy_merlin', 'castorama'] else []
-        products = scraper_instance.scrape_all(suppliers=suppliers)
-        
-        response = {
+        if supplier not in scraper_instance.scrapers:
+            return orjson_response({
+                "status": "error",
+                "message": f"Unknown supplier: {supplier}"
+            }, 404)
+
+        products = scraper_instance.scrape_all(suppliers=[supplier])
+
+        return orjson_response({
             "status": "success",
-            "timestamp": scraper_instance.get_api_response()["timestamp"],
+            "timestamp": datetime.now().isoformat(),
             "supplier": supplier,
             "count": len(products),
-            "products": [scraper.Product.__dict__ for product in products]
-        }
-        
-        return jsonify(response)
+            "products": products
+        })
         
     except Exception as e:
         logger.error(f"Error getting materials for supplier {supplier}: {e}")
-        return jsonify({
+        return orjson_response({
             "status": "error",
             "message": str(e)
-        }), 500
+        }, 500)
 
 @app.route('/categories', methods=['GET'])
 def get_categories():
     """Get available categories."""
     categories = ['tiles', 'sinks', 'toilets', 'paint', 'vanities', 'showers']
-    return jsonify({
+    return orjson_response({
         "status": "success",
         "categories": categories
     })
@@ -112,7 +119,7 @@ def get_categories():
 def get_suppliers():
     """Get available suppliers."""
     suppliers = ['leroy_merlin', 'castorama']
-    return jsonify({
+    return orjson_response({
         "status": "success",
         "suppliers": suppliers
     })
@@ -122,14 +129,14 @@ def trigger_scrape():
     """Trigger a new scraping job."""
     try:
         scraper_instance = initialize_scraper()
-        data = request.get_json() or {}
+        data = orjson.loads(request.data) if request.data else {}
         suppliers = data.get('suppliers')
         categories = data.get('categories')
         
         products = scraper_instance.scrape_all(suppliers=suppliers, categories=categories)
         scraper_instance.save_to_json(products)
         
-        return jsonify({
+        return orjson_response({
             "status": "success",
             "message": f"Scraped {len(products)} products",
             "count": len(products)
@@ -137,10 +144,17 @@ def trigger_scrape():
         
     except Exception as e:
         logger.error(f"Error in trigger_scrape: {e}")
-        return jsonify({
+        return orjson_response({
             "status": "error",
             "message": str(e)
-        }), 500
+        }, 500)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        # The single-threaded dev server head-of-line blocks every caller
+        # behind a running scrape; serve production traffic via gunicorn.
+        print("For production use:")
+        print("  gunicorn -c gunicorn.conf.py api_server:app")
+        print("For the development server, set FLASK_ENV=development")
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Gunicorn configuration for the Donizo Material Scraper API.
+
+Run with: gunicorn -c gunicorn.conf.py api_server:app
+"""
+
+import multiprocessing
+
+bind = "0.0.0.0:5000"
+workers = 2 * multiprocessing.cpu_count() + 1
+worker_class = "gevent"
+worker_connections = 1000
+timeout = 120  # scrape-triggering endpoints can be slow
+accesslog = "-"
+errorlog = "-"
@@ -4,24 +4,25 @@ Donizo Material Scraper
 A web scraper for extracting renovation material pricing data from French suppliers.
 """
 
-import json
+import os
 import time
+import random
 import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+import orjson
 import yaml
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin, urlparse
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from fake_useragent import UserAgent
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
+import soupsieve
 import re
 
 # Configure logging
@@ -31,8 +32,68 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Compiled once at import so the hot per-product extraction loops don't
+# re-enter the regex compiler
+_PRICE_RE = re.compile(r'([0-9]+(?:[.,][0-9]+)?)\s*(€|EUR)?', re.IGNORECASE)
+_WS = re.compile(r'\s+')
 
-@dataclass
+# Deletion table stripping everything but digits and separators from the
+# Latin-1 range plus the euro sign; one C-level translate pass beats the
+# regex engine on typical "25,99 €" strings
+_PRICE_TRANS = str.maketrans('', '', ''.join(
+    chr(c) for c in range(256) if chr(c) not in '0123456789,.'
+) + '€')
+_RE_CARD = re.compile(r'product-card|product-item|product')
+
+# CSS selectors for per-container field lookups; the substring matchers
+# run in soupsieve's C-backed matcher instead of walking every node with
+# a Python-level regex check
+_SEL_TITLE = 'h3, h2, [class*="title"], [class*="name"]'
+_SEL_PRICE = '[class*="price"], [class*="prix"]'
+_SEL_BRAND = '[class*="brand"], [class*="marque"]'
+
+# fake-useragent fetches and parses its UA database on first use, so
+# build one instance per process instead of one per scraper
+_UA_FALLBACK = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 '
+    '(KHTML, like Gecko) Version/17.1 Safari/605.1.15',
+    'Mozilla/5.0 (X11; Linux x86_64; rv:121.0) Gecko/20100101 Firefox/121.0',
+)
+try:
+    _UA = UserAgent()
+except Exception:
+    _UA = None
+
+
+def _get_selenium_driver(browser_config: Optional[Dict[str, Any]] = None):
+    """Build a headless Chrome driver for JS-rendered pages.
+
+    Selenium is an optional extra (`pip install .[selenium]`) and is only
+    imported here, so the requests-only path never pays its import cost.
+    """
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    browser_config = browser_config or {}
+    options = Options()
+    if browser_config.get('headless', True):
+        options.add_argument('--headless')
+    window_size = browser_config.get('window_size', '1920x1080')
+    options.add_argument(f"--window-size={window_size.replace('x', ',')}")
+
+    driver = webdriver.Chrome(
+        service=Service(ChromeDriverManager().install()),
+        options=options
+    )
+    driver.implicitly_wait(browser_config.get('implicit_wait', 10))
+    return driver
+
+
+@dataclass(slots=True, frozen=True)
 class Product:
     """Data class for product information."""
     product_name: str
@@ -51,26 +112,218 @@ class Product:
     sku: Optional[str] = None
 
 
+@lru_cache(maxsize=None)
+def _compiled_selector(css: str) -> soupsieve.SoupSieve:
+    """Compile a CSS selector once per process.
+
+    Selector strings stay picklable for the process-pool workers; each
+    worker compiles them on first use and then reuses the compiled
+    matcher for every container.
+    """
+    return soupsieve.compile(css)
+
+
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace and strip a scraped text value."""
+    if not text:
+        return ""
+    return _WS.sub(' ', text.strip())
+
+
+@lru_cache(maxsize=4096)
+def _parse_price(price_text: str) -> tuple[float, str]:
+    """Parse a scraped price string into (price, currency).
+
+    Scraped price strings repeat heavily ("25,99 €", "19,99 €", ...), so
+    the memoized result usually short-circuits the parse entirely.
+    """
+    if not price_text:
+        return 0.0, "EUR"
+
+    # Fast path: one translate pass covers normal price strings
+    cleaned = price_text.translate(_PRICE_TRANS).replace(',', '.')
+    try:
+        return float(cleaned), "EUR"  # Default to EUR for French sites
+    except ValueError:
+        pass
+
+    # Regex fallback: pick the first number out of inputs the translate
+    # pass can't reduce to a float (e.g. ranges or thousands separators)
+    match = _PRICE_RE.search(price_text)
+    if match:
+        return float(match.group(1).replace(',', '.')), "EUR"
+    return 0.0, "EUR"
+
+
+def _extract_product_from_container(container, category: str, base_url: str,
+                                    supplier: str, selectors: Dict[str, str],
+                                    timestamp: Optional[str] = None) -> Optional[Product]:
+    """Extract a Product from a parsed product-card container.
+
+    Module-level (rather than a method) so the process-pool worker can
+    share the exact extraction logic with the in-thread path.
+    """
+    try:
+        # Product name
+        name_elem = _compiled_selector(selectors['title']).select_one(container)
+        product_name = _normalize_text(name_elem.get_text()) if name_elem else "Unknown Product"
+        
+        # Product URL
+        link_elem = container.find('a')
+        product_url = urljoin(base_url, link_elem.get('href')) if link_elem else ""
+        
+        # Price
+        price_elem = _compiled_selector(selectors['price']).select_one(container)
+        price_text = _normalize_text(price_elem.get_text()) if price_elem else "0"
+        price, currency = _parse_price(price_text)
+        
+        # Brand
+        brand_elem = _compiled_selector(selectors['brand']).select_one(container)
+        brand = _normalize_text(brand_elem.get_text()) if brand_elem else None
+        
+        # Image URL
+        img_elem = container.find('img')
+        image_url = urljoin(base_url, img_elem.get('src')) if img_elem else None
+        
+        return Product(
+            product_name=product_name,
+            category=category,
+            price=price,
+            currency=currency,
+            product_url=product_url,
+            supplier=supplier,
+            timestamp=timestamp or datetime.now().isoformat(),
+            brand=brand,
+            image_url=image_url
+        )
+        
+    except Exception as e:
+        logger.error(f"Error extracting product info: {e}")
+        return None
+
+
+def _extract_from_fragment(html: str, category: str, base_url: str,
+                           supplier: str, selectors: Dict[str, str],
+                           timestamp: Optional[str] = None) -> Optional[Product]:
+    """Process-pool worker: re-parse an HTML fragment and extract from it."""
+    container = BeautifulSoup(html, 'lxml')
+    return _extract_product_from_container(container, category, base_url, supplier,
+                                           selectors, timestamp)
+
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Lazily build the shared process pool for CPU-bound extraction."""
+    global _parse_pool
+    if _parse_pool is None:
+        with _parse_pool_lock:
+            if _parse_pool is None:
+                _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
+
+
+class _TokenBucket:
+    """Thread-safe token bucket for per-host request pacing."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate  # tokens added per second
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1.0:
+                    self.tokens -= 1.0
+                    return
+                wait = (1.0 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+# One bucket per host, shared process-wide so concurrent workers split
+# the same budget instead of sleeping one-at-a-time in the request path
+_host_limiters: Dict[str, _TokenBucket] = {}
+_host_limiters_lock = threading.Lock()
+
+
+def _limiter_for_host(host: str, rate: float) -> _TokenBucket:
+    with _host_limiters_lock:
+        limiter = _host_limiters.get(host)
+        if limiter is None:
+            limiter = _TokenBucket(rate)
+            _host_limiters[host] = limiter
+        return limiter
+
+
 class BaseScraper:
     """Base class for all scrapers."""
     
-    def __init__(self, config: Dict[str, Any]):
+    def __init__(self, config: Dict[str, Any], session: Optional[requests.Session] = None):
         self.config = config
-        self.session = requests.Session()
-        self.ua = UserAgent()
-        self.session.headers.update({'User-Agent': self.ua.random})
+        if session is None:
+            # Standalone scrapers get their own pooled session so repeat
+            # fetches reuse the TCP+TLS connection; transient status
+            # codes are retried at the transport layer with backoff
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=64,
+                pool_maxsize=64,
+                max_retries=Retry(
+                    total=config['scraping']['max_retries'],
+                    backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504]
+                )
+            )
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+        self.session = session
+        user_agent = _UA.random if _UA else random.choice(_UA_FALLBACK)
+        self.session.headers.update({'User-Agent': user_agent})
+        # url -> (etag, parsed soup); lets a 304 skip download and re-parse
+        self._page_cache: Dict[str, tuple] = {}
+        self._page_cache_lock = threading.Lock()
         
     def _get_page(self, url: str) -> Optional[BeautifulSoup]:
         """Get page content with retry logic."""
+        with self._page_cache_lock:
+            cached = self._page_cache.get(url)
+
+        delay = self.config['scraping']['delay_between_requests']
+        limiter = _limiter_for_host(urlparse(url).netloc, 1.0 / delay) if delay > 0 else None
+
         for attempt in range(self.config['scraping']['max_retries']):
             try:
+                if limiter:
+                    limiter.acquire()
+                headers = {'If-None-Match': cached[0]} if cached else None
                 response = self.session.get(
-                    url, 
+                    url,
+                    headers=headers,
                     timeout=self.config['scraping']['timeout']
                 )
+                # Unchanged page: reuse the previously parsed tree and
+                # skip both the body download and the parse
+                if response.status_code == 304 and cached:
+                    return cached[1]
                 response.raise_for_status()
-                time.sleep(self.config['scraping']['delay_between_requests'])
-                return BeautifulSoup(response.content, 'html.parser')
+                # lxml is a C parser, several times faster than the
+                # stdlib html.parser on full listing pages
+                soup = BeautifulSoup(response.content, 'lxml')
+                etag = response.headers.get('ETag')
+                if etag:
+                    with self._page_cache_lock:
+                        self._page_cache[url] = (etag, soup)
+                return soup
             except Exception as e:
                 logger.warning(f"Attempt {attempt + 1} failed for {url}: {e}")
                 if attempt == self.config['scraping']['max_retries'] - 1:
@@ -81,35 +334,40 @@ class BaseScraper:
     
     def _extract_price(self, price_text: str) -> tuple[float, str]:
         """Extract price and currency from text."""
-        if not price_text:
-            return 0.0, "EUR"
-        
-        # Remove common price formatting
-        price_text = re.sub(r'[^\d,.]', '', price_text)
-        price_text = price_text.replace(',', '.')
-        
-        try:
-            price = float(price_text)
-            return price, "EUR"  # Default to EUR for French sites
-        except ValueError:
-            return 0.0, "EUR"
+        return _parse_price(price_text)
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize text."""
-        if not text:
-            return ""
-        return re.sub(r'\s+', ' ', text.strip())
+        return _normalize_text(text)
 
 
-class LeroyMerlinScraper(BaseScraper):
-    """Scraper for Leroy Merlin website."""
-    
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
-        self.base_url = config['suppliers']['leroy_merlin']['base_url']
-        self.categories = config['suppliers']['leroy_merlin']['categories']
-    
-    def scrape_category(self, category: str) -> List[Product]:
+class SiteScraper(BaseScraper):
+    """Config-driven scraper for a single supplier site.
+
+    All supplier-specific details (base URL, categories, display name and
+    optional CSS selector overrides) come from the `suppliers` section of
+    the configuration, so every supplier shares one code path.
+    """
+
+    def __init__(self, config: Dict[str, Any], supplier_key: str,
+                 session: Optional[requests.Session] = None):
+        super().__init__(config, session=session)
+        supplier_config = config['suppliers'][supplier_key]
+        self.supplier_key = supplier_key
+        self.display_name = supplier_config.get(
+            'name', supplier_key.replace('_', ' ').title()
+        )
+        self.base_url = supplier_config['base_url']
+        self.categories = supplier_config['categories']
+        selectors = supplier_config.get('selectors', {})
+        self.selectors = {
+            'title': selectors.get('title', _SEL_TITLE),
+            'price': selectors.get('price', _SEL_PRICE),
+            'brand': selectors.get('brand', _SEL_BRAND),
+        }
+
+    def scrape_category(self, category: str,
+                        timestamp: Optional[str] = None) -> List[Product]:
         """Scrape products from a specific category."""
         products = []
         category_config = self.categories.get(category)
@@ -124,92 +382,38 @@ class LeroyMerlinScraper(BaseScraper):
         soup = self._get_page(url)
         if not soup:
             return products
-        
-        # Find product containers
-        product_containers = soup.find_all('div', class_=re.compile(r'product-card|product-item'))
-        
-        for container in product_containers[:self.config['scraping']['max_products_per_category']]:
-            try:
-                product = self._extract_product_info(container, category)
-                if product:
-                    products.append(product)
-            except Exception as e:
-                logger.error(f"Error extracting product: {e}")
-                continue
-        
-        return products
-    
-    def _extract_product_info(self, container, category: str) -> Optional[Product]:
-        """Extract product information from a container."""
-        try:
-            # Product name
-            name_elem = container.find('h3') or container.find('h2') or container.find(class_=re.compile(r'title|name'))
-            product_name = self._clean_text(name_elem.get_text()) if name_elem else "Unknown Product"
-            
-            # Product URL
-            link_elem = container.find('a')
-            product_url = urljoin(self.base_url, link_elem.get('href')) if link_elem else ""
-            
-            # Price
-            price_elem = container.find(class_=re.compile(r'price|prix'))
-            price_text = self._clean_text(price_elem.get_text()) if price_elem else "0"
-            price, currency = self._extract_price(price_text)
-            
-            # Brand
-            brand_elem = container.find(class_=re.compile(r'brand|marque'))
-            brand = self._clean_text(brand_elem.get_text()) if brand_elem else None
-            
-            # Image URL
-            img_elem = container.find('img')
-            image_url = urljoin(self.base_url, img_elem.get('src')) if img_elem else None
-            
-            return Product(
-                product_name=product_name,
-                category=category,
-                price=price,
-                currency=currency,
-                product_url=product_url,
-                supplier="Leroy Merlin",
-                timestamp=datetime.now().isoformat(),
-                brand=brand,
-                image_url=image_url
-            )
-            
-        except Exception as e:
-            logger.error(f"Error extracting product info: {e}")
-            return None
 
+        # One timestamp per batch instead of a datetime.now() per product
+        batch_ts = timestamp or datetime.now().isoformat()
 
-class CastoramaScraper(BaseScraper):
-    """Scraper for Castorama website."""
-    
-    def __init__(self, config: Dict[str, Any]):
-        super().__init__(config)
-        self.base_url = config['suppliers']['castorama']['base_url']
-        self.categories = config['suppliers']['castorama']['categories']
-    
-    def scrape_category(self, category: str) -> List[Product]:
-        """Scrape products from a specific category."""
-        products = []
-        category_config = self.categories.get(category)
-        
-        if not category_config:
-            logger.error(f"Category {category} not found in configuration")
-            return products
-        
-        url = urljoin(self.base_url, category_config['url_path'])
-        logger.info(f"Scraping {category} from {url}")
-        
-        soup = self._get_page(url)
-        if not soup:
+        # Find product containers; limit= makes find_all stop traversing
+        # the DOM once enough cards have matched
+        containers = soup.find_all(
+            'div', class_=_RE_CARD,
+            limit=self.config['scraping']['max_products_per_category']
+        )
+
+        # Extraction is pure CPU (parse + text cleaning), so large batches
+        # go to the shared process pool to sidestep the GIL
+        threshold = self.config['scraping'].get('parallel_parse_threshold', 25)
+        if len(containers) >= threshold:
+            worker = partial(
+                _extract_from_fragment,
+                category=category,
+                base_url=self.base_url,
+                supplier=self.display_name,
+                selectors=self.selectors,
+                timestamp=batch_ts
+            )
+            fragments = [str(container) for container in containers]
+            for product in _get_parse_pool().map(worker, fragments, chunksize=16):
+                if product:
+                    products.append(product)
             return products
-        
-        # Find product containers
-        product_containers = soup.find_all('div', class_=re.compile(r'product-card|product-item|product'))
-        
-        for container in product_containers[:self.config['scraping']['max_products_per_category']]:
+
+        for container in containers:
             try:
-                product = self._extract_product_info(container, category)
+                product = self._extract_product_info(container, category, batch_ts)
                 if product:
                     products.append(product)
             except Exception as e:
@@ -218,45 +422,27 @@ class CastoramaScraper(BaseScraper):
         
         return products
     
-    def _extract_product_info(self, container, category: str) -> Optional[Product]:
+    def _extract_product_info(self, container, category: str,
+                              timestamp: Optional[str] = None) -> Optional[Product]:
         """Extract product information from a container."""
-        try:
-            # Product name
-            name_elem = container.find('h3') or container.find('h2') or container.find(class_=re.compile(r'title|name'))
-            product_name = self._clean_text(name_elem.get_text()) if name_elem else "Unknown Product"
-            
-            # Product URL
-            link_elem = container.find('a')
-            product_url = urljoin(self.base_url, link_elem.get('href')) if link_elem else ""
-            
-            # Price
-            price_elem = container.find(class_=re.compile(r'price|prix'))
-            price_text = self._clean_text(price_elem.get_text()) if price_elem else "0"
-            price, currency = self._extract_price(price_text)
-            
-            # Brand
-            brand_elem = container.find(class_=re.compile(r'brand|marque'))
-            brand = self._clean_text(brand_elem.get_text()) if brand_elem else None
-            
-            # Image URL
-            img_elem = container.find('img')
-            image_url = urljoin(self.base_url, img_elem.get('src')) if img_elem else None
-            
-            return Product(
-                product_name=product_name,
-                category=category,
-                price=price,
-                currency=currency,
-                product_url=product_url,
-                supplier="Castorama",
-                timestamp=datetime.now().isoformat(),
-                brand=brand,
-                image_url=image_url
-            )
-            
-        except Exception as e:
-            logger.error(f"Error extracting product info: {e}")
-            return None
+        return _extract_product_from_container(
+            container, category, self.base_url, self.display_name,
+            self.selectors, timestamp
+        )
+
+
+class LeroyMerlinScraper(SiteScraper):
+    """Scraper for Leroy Merlin website."""
+
+    def __init__(self, config: Dict[str, Any], session: Optional[requests.Session] = None):
+        super().__init__(config, 'leroy_merlin', session=session)
+
+
+class CastoramaScraper(SiteScraper):
+    """Scraper for Castorama website."""
+
+    def __init__(self, config: Dict[str, Any], session: Optional[requests.Session] = None):
+        super().__init__(config, 'castorama', session=session)
 
 
 class MaterialScraper:
@@ -265,16 +451,40 @@ class MaterialScraper:
     def __init__(self, config_path: str = "config/scraper_config.yaml"):
         """Initialize the scraper with configuration."""
         self.config = self._load_config(config_path)
+        self.session = self._build_session()
+        # (category,) -> (monotonic timestamp, response dict)
+        self._api_cache: Dict[tuple, tuple] = {}
+        self._api_cache_lock = threading.Lock()
         self.scrapers = {
-            'leroy_merlin': LeroyMerlinScraper(self.config),
-            'castorama': CastoramaScraper(self.config)
+            'leroy_merlin': LeroyMerlinScraper(self.config, session=self.session),
+            'castorama': CastoramaScraper(self.config, session=self.session)
         }
+
+    def _build_session(self) -> requests.Session:
+        """Build a single pooled session shared by all scrapers.
+
+        Keep-alive connection reuse skips the TCP+TLS handshake on repeat
+        requests to the same supplier host.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            pool_maxsize=64,
+            max_retries=Retry(total=0)
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers['Connection'] = 'keep-alive'
+        return session
     
     def _load_config(self, config_path: str) -> Dict[str, Any]:
         """Load configuration from YAML file."""
         try:
             with open(config_path, 'r', encoding='utf-8') as file:
-                return yaml.safe_load(file)
+                # Use the libyaml-backed loader when PyYAML was built
+                # with it; same safe-loading semantics either way
+                loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+                return yaml.load(file, Loader=loader)
         except Exception as e:
             logger.error(f"Error loading config: {e}")
             raise
@@ -287,55 +497,132 @@ class MaterialScraper:
         if categories is None:
             categories = ['tiles', 'sinks', 'toilets', 'paint', 'vanities', 'showers']
         
-        all_products = []
-        
+        valid_suppliers = []
         for supplier in suppliers:
             if supplier not in self.scrapers:
                 logger.warning(f"Supplier {supplier} not found")
                 continue
-            
-            scraper = self.scrapers[supplier]
-            logger.info(f"Starting scraping for {supplier}")
-            
-            for category in categories:
+            valid_suppliers.append(supplier)
+        suppliers = valid_suppliers
+
+        # Each scrape_category call is I/O-bound, so overlap them in a
+        # thread pool; a per-supplier semaphore keeps at most two
+        # concurrent requests on any one host.
+        semaphores = {supplier: threading.Semaphore(2) for supplier in suppliers}
+
+        # Stamp the whole run once; scrape_category passes it through to
+        # every extracted product
+        run_ts = datetime.now().isoformat()
+
+        def scrape_one(supplier: str, category: str) -> List[Product]:
+            with semaphores[supplier]:
+                return self.scrapers[supplier].scrape_category(category, timestamp=run_ts)
+
+        all_products = []
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = {
+                executor.submit(scrape_one, supplier, category): (supplier, category)
+                for supplier in suppliers
+                for category in categories
+            }
+            for future in as_completed(futures):
+                supplier, category = futures[future]
                 try:
-                    products = scraper.scrape_category(category)
+                    products = future.result() or []
                     all_products.extend(products)
                     logger.info(f"Scraped {len(products)} products from {supplier} - {category}")
                 except Exception as e:
                     logger.error(f"Error scraping {category} from {supplier}: {e}")
                     continue
-        
-        return all_products
+
+        # Drop duplicates from pagination/category overlap, keyed on
+        # product URL; products without a URL are always kept
+        seen_urls = set()
+        unique_products = []
+        for product in all_products:
+            url = product.product_url
+            if url:
+                if url in seen_urls:
+                    continue
+                seen_urls.add(url)
+            unique_products.append(product)
+
+        return unique_products
     
     def save_to_json(self, products: List[Product], output_path: str = "data/materials.json"):
         """Save products to JSON file."""
         try:
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
-            
-            products_data = [asdict(product) for product in products]
-            
-            with open(output_path, 'w', encoding='utf-8') as file:
-                json.dump(products_data, file, indent=2, ensure_ascii=False)
-            
+
+            # orjson serializes the Product dataclasses directly, so no
+            # intermediate asdict() pass is needed
+            with open(output_path, 'wb') as file:
+                file.write(orjson.dumps(
+                    products,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS |
+                            orjson.OPT_APPEND_NEWLINE)
+                ))
+
             logger.info(f"Saved {len(products)} products to {output_path}")
-            
+
         except Exception as e:
             logger.error(f"Error saving to JSON: {e}")
             raise
-    
+
+    def save_to_jsonl(self, products: List[Product], output_path: str = "data/materials.jsonl"):
+        """Save products as line-delimited JSON, one product per line.
+
+        Streams each product through a large buffered binary handle, so
+        peak memory stays bounded by one serialized product and
+        downstream consumers can read the file incrementally.
+        """
+        try:
+            os.makedirs(os.path.dirname(output_path), exist_ok=True)
+
+            with open(output_path, 'wb', buffering=1 << 20) as file:
+                for product in products:
+                    file.write(orjson.dumps(
+                        product,
+                        option=(orjson.OPT_SERIALIZE_DATACLASS |
+                                orjson.OPT_APPEND_NEWLINE)
+                    ))
+
+            logger.info(f"Saved {len(products)} products to {output_path}")
+
+        except Exception as e:
+            logger.error(f"Error saving to JSONL: {e}")
+            raise
+
     def get_api_response(self, category: str = None) -> Dict[str, Any]:
-        """Simulate API response for a specific category."""
+        """Simulate API response for a specific category.
+
+        Responses are cached in-process for `scraping.cache_ttl` seconds
+        (default 300) so repeated API hits don't trigger a full scrape.
+        """
+        cache_key = (category,)
+        ttl = self.config['scraping'].get('cache_ttl', 300)
+
+        with self._api_cache_lock:
+            cached = self._api_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
         products = self.scrape_all(categories=[category] if category else None)
-        
-        return {
+
+        response = {
             "status": "success",
             "timestamp": datetime.now().isoformat(),
             "category": category,
             "count": len(products),
-            "products": [asdict(product) for product in products]
+            "products": products
         }
 
+        with self._api_cache_lock:
+            self._api_cache[cache_key] = (time.monotonic(), response)
+
+        return response
+
 
 def main():
     """Main function to run the scraper."""
@@ -356,5 +643,4 @@ def main():
 
 
 if __name__ == "__main__":
-    import os
     main()
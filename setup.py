@@ -32,14 +32,12 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
         "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.8",
-        "Programming Language :: Python :: 3.9",
         "Programming Language :: Python :: 3.10",
         "Programming Language :: Python :: 3.11",
         "Topic :: Internet :: WWW/HTTP :: Browsers",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=read_requirements(),
     extras_require={
         "dev": [
@@ -47,6 +45,10 @@ setup(
             "pytest-mock>=3.12.0",
             "pytest-cov>=4.1.0",
         ],
+        "selenium": [
+            "selenium>=4.15.2",
+            "webdriver-manager>=4.0.1",
+        ],
     },
     entry_points={
         "console_scripts": [
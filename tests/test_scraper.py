@@ -63,7 +63,7 @@ class TestProduct:
 class TestBaseScraper:
     """Test the BaseScraper class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
         """Mock configuration for testing."""
         return {
@@ -74,7 +74,7 @@ class TestBaseScraper:
             }
         }
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def base_scraper(self, mock_config):
         """Create a BaseScraper instance for testing."""
         return BaseScraper(mock_config)
@@ -106,7 +106,7 @@ class TestBaseScraper:
     def test_get_page_success(self, mock_get, base_scraper):
         """Test successful page retrieval."""
         mock_response = Mock()
-        mock_response.content = "<html><body>Test</body></html>"
+        mock_response.content = b"<html><body>Test</body></html>"
         mock_response.raise_for_status.return_value = None
         mock_get.return_value = mock_response
         
@@ -126,7 +126,7 @@ class TestBaseScraper:
 class TestLeroyMerlinScraper:
     """Test the LeroyMerlinScraper class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
         """Mock configuration for Leroy Merlin scraper."""
         return {
@@ -148,7 +148,7 @@ class TestLeroyMerlinScraper:
             }
         }
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def scraper(self, mock_config):
         """Create a LeroyMerlinScraper instance for testing."""
         return LeroyMerlinScraper(mock_config)
@@ -192,7 +192,7 @@ class TestLeroyMerlinScraper:
 class TestCastoramaScraper:
     """Test the CastoramaScraper class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_config(self):
         """Mock configuration for Castorama scraper."""
         return {
@@ -214,7 +214,7 @@ class TestCastoramaScraper:
             }
         }
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def scraper(self, mock_config):
         """Create a CastoramaScraper instance for testing."""
         return CastoramaScraper(mock_config)
@@ -228,8 +228,8 @@ class TestCastoramaScraper:
 class TestMaterialScraper:
     """Test the MaterialScraper class."""
     
-    @pytest.fixture
-    def mock_config_file(self):
+    @pytest.fixture(scope="module")
+    def mock_config_file(self, request):
         """Create a temporary config file for testing."""
         config_content = """
 suppliers:
@@ -260,9 +260,11 @@ output:
         
         with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
             f.write(config_content)
-            return f.name
+            config_path = f.name
+        request.addfinalizer(lambda: os.unlink(config_path))
+        return config_path
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def scraper(self, mock_config_file):
         """Create a MaterialScraper instance for testing."""
         return MaterialScraper(mock_config_file)
@@ -309,6 +311,25 @@ output:
         products = scraper.scrape_all()
         assert len(products) > 0
     
+    @patch.object(LeroyMerlinScraper, 'scrape_category')
+    @patch.object(CastoramaScraper, 'scrape_category')
+    def test_scrape_all_deduplicates(self, mock_castorama, mock_leroy, scraper):
+        """Test that duplicate product URLs are dropped."""
+        duplicate = Product(
+            product_name="Test Product",
+            category="tiles",
+            price=25.99,
+            currency="EUR",
+            product_url="https://example.com/duplicate",
+            supplier="Leroy Merlin",
+            timestamp="2023-12-01T10:00:00"
+        )
+        mock_leroy.return_value = [duplicate]
+        mock_castorama.return_value = [duplicate]
+
+        products = scraper.scrape_all()
+        assert len(products) == 1
+
     def test_save_to_json(self, scraper):
         """Test saving products to JSON."""
         products = [
@@ -338,6 +359,34 @@ output:
         finally:
             os.unlink(output_path)
     
+    def test_save_to_jsonl(self, scraper):
+        """Test saving products to line-delimited JSON."""
+        products = [
+            Product(
+                product_name="Test Product",
+                category="tiles",
+                price=25.99,
+                currency="EUR",
+                product_url="https://example.com/product",
+                supplier="Leroy Merlin",
+                timestamp="2023-12-01T10:00:00"
+            )
+        ]
+
+        with tempfile.NamedTemporaryFile(suffix='.jsonl', delete=False) as f:
+            output_path = f.name
+
+        try:
+            scraper.save_to_jsonl(products, output_path)
+
+            # Verify one JSON document per line
+            with open(output_path, 'r') as f:
+                data = [json.loads(line) for line in f]
+                assert len(data) == 1
+                assert data[0]['product_name'] == "Test Product"
+        finally:
+            os.unlink(output_path)
+
     def test_get_api_response(self, scraper):
         """Test API response generation."""
         response = scraper.get_api_response("tiles")
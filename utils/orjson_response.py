@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+"""
+orjson-backed response helper for the Donizo Material Scraper API.
+"""
+
+import orjson
+from flask import Response
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_DATACLASS | orjson.OPT_NON_STR_KEYS
+
+
+def orjson_response(payload, status=200):
+    """Build a Flask JSON response serialized with orjson.
+
+    Serializes Product dataclasses directly, so handlers can put raw
+    dataclass instances in their payloads without an asdict() pass.
+    """
+    body = orjson.dumps(payload, option=_ORJSON_OPTIONS)
+    return Response(body, status=status, mimetype='application/json')